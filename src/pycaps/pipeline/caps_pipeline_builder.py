@@ -102,7 +102,8 @@ class CapsPipelineBuilder:
                 language=current._language,
                 initial_prompt=current._initial_prompt,
                 portuguese_vocabulary=current._portuguese_vocabulary,
-                anti_hallucination_config=preset
+                anti_hallucination_config=preset,
+                backend=current._backend
             )
         else:
             # Create new WhisperAudioTranscriber with preset
@@ -2,6 +2,7 @@
 Configuration for anti-hallucination features in Whisper transcription.
 """
 
+import logging
 from typing import Optional, Dict, Any
 from dataclasses import dataclass, field
 from pycaps.logger import logger
@@ -21,6 +22,7 @@ class AntiHallucinationConfig:
     overlap: int = 2  # seconds
     min_chunk_duration: float = 5.0  # minimum chunk duration
     use_chunking_threshold: float = 90.0  # use chunking for videos longer than this
+    num_workers: int = 2  # chunks transcribed concurrently
     
     # Adaptive Thresholds
     adaptive_thresholds: bool = True
@@ -158,16 +160,21 @@ class AntiHallucinationConfig:
 
     def log_configuration(self, duration: float):
         """Log the active configuration for debugging."""
-        logger().info(f"Anti-hallucination config for {duration:.1f}s video:")
-        logger().info(f"  VAD: {self.enable_vad} ({self.vad_provider})")
-        logger().info(f"  Chunking: {self.should_use_chunking(duration)} (chunk_length={self.chunk_length}s, overlap={self.overlap}s)")
-        logger().info(f"  Adaptive thresholds: {self.adaptive_thresholds}")
+        if not logger().isEnabledFor(logging.INFO):
+            return
         
+        # One record for the whole configuration instead of one per line
+        lines = [
+            f"Anti-hallucination config for {duration:.1f}s video:",
+            f"  VAD: {self.enable_vad} ({self.vad_provider})",
+            f"  Chunking: {self.should_use_chunking(duration)} (chunk_length={self.chunk_length}s, overlap={self.overlap}s)",
+            f"  Adaptive thresholds: {self.adaptive_thresholds}",
+        ]
         if self.adaptive_thresholds:
-            params = self.get_whisper_params(duration)
-            logger().info(f"  Whisper params: {params}")
+            lines.append(f"  Whisper params: {self.get_whisper_params(duration)}")
+        lines.append(f"  Filters: repetition={self.enable_repetition_filter}, semantic={self.enable_semantic_filter}, compression={self.enable_compression_filter}")
         
-        logger().info(f"  Filters: repetition={self.enable_repetition_filter}, semantic={self.enable_semantic_filter}, compression={self.enable_compression_filter}")
+        logger().info("\n".join(lines))
 
 
 # Preset configurations for common scenarios
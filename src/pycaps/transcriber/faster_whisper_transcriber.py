@@ -1,14 +1,15 @@
 """Faster-Whisper transcriber with better hallucination prevention."""
 
 import logging
-from typing import Optional, List, Dict, Any
-from faster_whisper import WhisperModel
-from faster_whisper.vad import get_vad_model, VadOptions
+from typing import Optional, List, Dict, Any, TYPE_CHECKING
 import numpy as np
 from ..common.models import Document, Segment, Word, TimeFragment
 from ..common.element_container import ElementContainer
 from .base_transcriber import AudioTranscriber
 
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
 logger = logging.getLogger(__name__)
 
 
@@ -61,6 +62,7 @@ class FasterWhisperTranscriber(AudioTranscriber):
         
         # Initialize VAD options if enabled
         if self.use_vad:
+            from faster_whisper.vad import VadOptions
             self.vad_options = VadOptions(
                 threshold=vad_threshold,
                 min_speech_duration_ms=vad_min_speech_duration_ms,
@@ -72,9 +74,10 @@ class FasterWhisperTranscriber(AudioTranscriber):
         # Load model
         self._model = None
         
-    def _get_model(self) -> WhisperModel:
+    def _get_model(self) -> "WhisperModel":
         """Lazy load the model."""
         if self._model is None:
+            from faster_whisper import WhisperModel
             logger.info(f"Loading faster-whisper model: {self.model_size}")
             self._model = WhisperModel(
                 self.model_size, 
@@ -96,7 +99,11 @@ class FasterWhisperTranscriber(AudioTranscriber):
         model = self._get_model()
         
         # Get VAD model if enabled
-        vad_model = get_vad_model() if self.use_vad else None
+        if self.use_vad:
+            from faster_whisper.vad import get_vad_model
+            vad_model = get_vad_model()
+        else:
+            vad_model = None
         
         logger.info(f"Transcribing with faster-whisper (VAD: {self.use_vad})")
         
@@ -1,19 +1,201 @@
 from .base_transcriber import AudioTranscriber
 from .anti_hallucination_config import AntiHallucinationConfig, PresetConfigs
-from typing import Optional, Any, List, Tuple, Union
+from typing import Optional, Any, Dict, List, Literal, Tuple, Union
 from pycaps.common import Document, Segment, Line, Word, TimeFragment
 from pycaps.logger import logger
+import functools
+import math
+import os
 import re
-import librosa
+import subprocess
+import threading
+import zlib
+import soundfile as sf
+import soxr
 import numpy as np
-import tempfile
-import os
+from rapidfuzz.distance import Indel
 from pathlib import Path
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+WHISPER_SAMPLE_RATE = 16000
+VAD_WINDOW_SIZE = 512  # Silero VAD v5 only accepts 512-sample windows at 16kHz
+VAD_BATCH_SIZE = 64
+# Same as Silero's get_speech_timestamps defaults: speech starts at VAD_THRESHOLD, only ends below
+# VAD_THRESHOLD - 0.15, and every segment is padded by VAD_SPEECH_PAD seconds on both sides
+VAD_THRESHOLD = 0.5
+VAD_NEG_THRESHOLD = VAD_THRESHOLD - 0.15
+VAD_SPEECH_PAD = 0.03
+MIN_TIME_FRAGMENT = 0.01  # seconds; Whisper sometimes emits zero-length words/segments
+
+# Audio durations keyed by (path, mtime), shared by every transcriber in the process
+_AUDIO_DURATION_CACHE: Dict[Tuple[str, float], float] = {}
+
+# Preset names accepted for anti_hallucination_config. These are factories rather than shared
+# instances because configs are mutable (legacy constructor parameters are written into them).
+_PRESET_FACTORIES = {
+    "maximum_quality": PresetConfigs.maximum_quality,
+    "balanced": PresetConfigs.balanced,
+    "fast_processing": PresetConfigs.fast_processing,
+    "podcasts": PresetConfigs.podcasts,
+    "short_videos": PresetConfigs.short_videos,
+}
+
+# Specific religious/biblical terms that get misrecognized
+_RELIGIOUS_CORRECTIONS = {
+    "jet semany": "Getsêmani",
+    "jet sê mani": "Getsêmani",
+    "get semany": "Getsêmani",
+    "jets emany": "Getsêmani",
+    "jet semani": "Getsêmani",
+    "bem aventurança": "bem-aventurança",
+    "bem aventurado": "bem-aventurado",
+    "cruz sagrada": "cruz-sagrada",
+    "pós ressurreição": "pós-ressurreição",
+}
+# All corrections as one alternation, so each line is scanned once; group r<N> maps to replacement N
+_RELIGIOUS_PATTERN = re.compile(
+    "|".join(f"(?P<r{i}>{re.escape(incorrect)})" for i, incorrect in enumerate(_RELIGIOUS_CORRECTIONS)),
+    re.IGNORECASE,
+)
+_RELIGIOUS_REPLACEMENTS = list(_RELIGIOUS_CORRECTIONS.values())
+
+# Portuguese compound words that Whisper tends to split into separate tokens
+_REFLEXIVE_PATTERN = re.compile(r'\b(\w+)\s+(se|me|te|nos|lhe|lhes)\b', re.IGNORECASE)
+_PREFIX_PATTERN = re.compile(r'\b(bem|mal|auto|anti|pós|pré|sobre|sub)\s+(\w+)', re.IGNORECASE)
+
+# Phrases Whisper is known to loop on, as (lowercased phrase, segment length limit): only segments
+# shorter than the limit count as a repetition, longer ones are real sentences that contain the phrase
+_REPETITIVE_PHRASES = [
+    (phrase.lower(), len(phrase) + 15)
+    for phrase in [
+        "E aí ele falou, ó, eu sou gay",
+        "ele falou, ó, eu sou gay",
+        "aí ele falou, ó, eu sou gay",
+        "você pode me ajudar",
+        "muito obrigado",
+        "por favor",
+    ]
+]
+
+def _lazy_njit(fn):
+    """Compile `fn` with Numba on its first call instead of at import time (numba itself is slow to import).
+    
+    numba comes with librosa, but these kernels work as plain Python too, so without it `fn` runs as is.
+    """
+    compiled = None
+    
+    @functools.wraps(fn)
+    def wrapper(*args):
+        nonlocal compiled
+        if compiled is None:
+            try:
+                from numba import njit
+            except ImportError:
+                compiled = fn
+            else:
+                compiled = njit(cache=True)(fn)
+        return compiled(*args)
+    
+    return wrapper
+
+@_lazy_njit
+def _scan_speech_segments(speech: np.ndarray, hop_length: int, sample_rate: int, total_duration: float,
+                          min_duration: float, merge_gap: float) -> np.ndarray:
+    """Turn per-frame speech flags into (start, end) rows, dropping short runs and merging close ones."""
+    segments = np.empty((len(speech) + 1, 2), dtype=np.float64)
+    count = 0
+    start = -1.0
+    for i in range(len(speech) + 1):
+        if i < len(speech):
+            if speech[i]:
+                if start < 0.0:
+                    start = i * hop_length / sample_rate
+                continue
+            if start < 0.0:
+                continue
+            end = i * hop_length / sample_rate
+        else:
+            # Close final segment if needed
+            if start < 0.0:
+                break
+            end = total_duration
+
+        if end - start >= min_duration:
+            if count > 0 and start - segments[count - 1, 1] < merge_gap:
+                segments[count - 1, 1] = end
+            else:
+                segments[count, 0] = start
+                segments[count, 1] = end
+                count += 1
+        start = -1.0
+    return segments[:count]
+
+@_lazy_njit
+def _hysteresis_flags(probabilities: np.ndarray, threshold: float, neg_threshold: float) -> np.ndarray:
+    """Per-window speech flags that switch on at `threshold` and only switch off below `neg_threshold`."""
+    flags = np.empty(len(probabilities), dtype=np.bool_)
+    speaking = False
+    for i in range(len(probabilities)):
+        if probabilities[i] >= threshold:
+            speaking = True
+        elif probabilities[i] < neg_threshold:
+            speaking = False
+        flags[i] = speaking
+    return flags
+
+@_lazy_njit
+def _length_compatible_pairs(lengths: np.ndarray, threshold: float) -> np.ndarray:
+    """Return (i, j) rows, i < j, whose lengths alone still allow a text similarity above `threshold`.
+    
+    Indel similarity = 2 * LCS / (len_i + len_j) and LCS <= min(len_i, len_j), so other pairs can be skipped exactly.
+    """
+    n = len(lengths)
+    pairs = np.empty((n * (n - 1) // 2, 2), dtype=np.int64)
+    count = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            if 2.0 * min(lengths[i], lengths[j]) / (lengths[i] + lengths[j]) > threshold:
+                pairs[count, 0] = i
+                pairs[count, 1] = j
+                count += 1
+    return pairs[:count]
+
+# MinHash/LSH prefilter for near-duplicate segment texts: 20 bands of 3 rows
+MINHASH_SHINGLE_SIZE = 4
+MINHASH_BANDS = 20
+MINHASH_ROWS = 3
+_MINHASH_RNG = np.random.default_rng(0x5EED)
+_MINHASH_MULTIPLIERS = _MINHASH_RNG.integers(1, 2**63, MINHASH_BANDS * MINHASH_ROWS, dtype=np.uint64) | np.uint64(1)
+_MINHASH_INCREMENTS = _MINHASH_RNG.integers(0, 2**63, MINHASH_BANDS * MINHASH_ROWS, dtype=np.uint64)
+
+def _minhash_signatures(texts: List[str]) -> np.ndarray:
+    """Return a (N, MINHASH_BANDS * MINHASH_ROWS) uint64 MinHash signature of each text's character shingles."""
+    signatures = np.empty((len(texts), len(_MINHASH_MULTIPLIERS)), dtype=np.uint64)
+    for row, text in enumerate(texts):
+        shingles = {text[i:i + MINHASH_SHINGLE_SIZE] for i in range(max(len(text) - MINHASH_SHINGLE_SIZE + 1, 1))}
+        # crc32 rather than hash(): str hashes are salted per process, which would make the filter non-deterministic
+        hashes = np.fromiter((zlib.crc32(shingle.encode()) for shingle in shingles), dtype=np.uint64, count=len(shingles))
+        # Universal hashing mod 2**64 (uint64 arithmetic wraps around)
+        signatures[row] = (hashes[:, None] * _MINHASH_MULTIPLIERS + _MINHASH_INCREMENTS).min(axis=0)
+    return signatures
 
 class WhisperAudioTranscriber(AudioTranscriber):
+    # Silero VAD (model, utils), shared by every instance in the process. The model is stateful
+    # (recurrent state, device), so loading it and running inference both hold _VAD_LOCK.
+    _VAD_SINGLETON: Optional[Tuple[Any, Any]] = None
+    _VAD_LOCK = threading.Lock()
+    # Whisper models keyed by (backend, model name, num_workers), shared by every instance in the process
+    _MODEL_CACHE: Dict[Tuple[str, str, int], Any] = {}
+    _MODEL_CACHE_LOCK = threading.Lock()
+    # openai-whisper installs kv-cache hooks on the model per call, so a model can't decode concurrently.
+    # Models are shared through _MODEL_CACHE, so this has to be a class-level lock, not a per-instance one.
+    _OPENAI_DECODE_LOCK = threading.Lock()
+
     def __init__(self, model_size: str = "medium", language: Optional[str] = None, model: Optional[Any] = None, 
                  initial_prompt: Optional[str] = None, portuguese_vocabulary: Optional[List[str]] = None,
                  anti_hallucination_config: Optional[Union[AntiHallucinationConfig, str]] = None,
+                 backend: Optional[Literal["openai", "faster"]] = None,
                  # Legacy parameters for backward compatibility
                  enable_vad: Optional[bool] = None, chunk_length: Optional[int] = None, 
                  overlap: Optional[int] = None, adaptive_thresholds: Optional[bool] = None):
@@ -24,13 +206,17 @@ class WhisperAudioTranscriber(AudioTranscriber):
         Args:
             model_size: Size of the Whisper model to use (e.g., "tiny", "base", "medium").
             language: Language of the audio (e.g., "en", "pt").
-            model: (Optional) A pre-loaded Whisper model instance. If provided, model_size is ignored.
+            model: (Optional) A pre-loaded Whisper model instance matching `backend`. If provided, model_size is ignored.
             initial_prompt: Custom prompt to guide transcription (max 244 tokens).
             portuguese_vocabulary: List of Portuguese compound/religious terms to recognize.
             anti_hallucination_config: Configuration for anti-hallucination features. Can be:
                 - AntiHallucinationConfig object
                 - String preset: "maximum_quality", "balanced", "fast_processing", "podcasts", "short_videos"
                 - None (uses duration-based auto configuration)
+            backend: Inference engine to run Whisper with:
+                - "faster": faster-whisper (CTranslate2), several times faster with lower memory usage
+                - "openai": the reference openai-whisper package (must be installed separately)
+                - None: inferred from `model` when one is given, "faster" otherwise
             
             Legacy parameters (deprecated, use anti_hallucination_config instead):
             enable_vad: Enable Voice Activity Detection preprocessing for long videos.
@@ -41,15 +227,37 @@ class WhisperAudioTranscriber(AudioTranscriber):
         self._model_size = model_size
         self._language = language
         self._model = model
+        self._backend = self._resolve_backend(backend, model)
         self._initial_prompt = initial_prompt
         self._portuguese_vocabulary = portuguese_vocabulary or []
+        self._cached_portuguese_prompt: Optional[str] = None
         self._vad_model = None
+        self._model_load_lock = threading.Lock()  # preload() and transcribe() may both ask for the model
+        self._executor = ThreadPoolExecutor(max_workers=2)  # Background work overlapped with model loading
         
         # Handle anti-hallucination configuration
         self._config = self._initialize_config(
             anti_hallucination_config, enable_vad, chunk_length, overlap, adaptive_thresholds
         )
 
+    @staticmethod
+    def _resolve_backend(backend: Optional[str], model: Optional[Any]) -> str:
+        """Pick the backend matching a pre-loaded model, so callers passing an openai-whisper model keep working."""
+        if model is None:
+            return backend or "faster"
+        
+        model_package = type(model).__module__.split(".")[0]
+        model_backend = {"faster_whisper": "faster", "whisper": "openai"}.get(model_package)
+        if model_backend is None:
+            # Unknown model type (e.g. a wrapper): trust the caller, defaulting to the original openai-whisper API
+            return backend or "openai"
+        if backend is not None and backend != model_backend:
+            raise ValueError(
+                f"backend='{backend}' doesn't match the provided model ({type(model).__module__}.{type(model).__name__}), "
+                f"which needs backend='{model_backend}'"
+            )
+        return model_backend
+
     def _initialize_config(self, config: Optional[Union[AntiHallucinationConfig, str]], 
                           enable_vad: Optional[bool], chunk_length: Optional[int], 
                           overlap: Optional[int], adaptive_thresholds: Optional[bool]) -> AntiHallucinationConfig:
@@ -57,16 +265,8 @@ class WhisperAudioTranscriber(AudioTranscriber):
         
         # If config is provided as string (preset)
         if isinstance(config, str):
-            preset_map = {
-                "maximum_quality": PresetConfigs.maximum_quality,
-                "balanced": PresetConfigs.balanced,
-                "fast_processing": PresetConfigs.fast_processing,
-                "podcasts": PresetConfigs.podcasts,
-                "short_videos": PresetConfigs.short_videos,
-            }
-            
-            if config in preset_map:
-                return preset_map[config]()
+            if config in _PRESET_FACTORIES:
+                return _PRESET_FACTORIES[config]()
             else:
                 logger().warning(f"Unknown preset '{config}', using balanced configuration")
                 return PresetConfigs.balanced()
@@ -97,7 +297,23 @@ class WhisperAudioTranscriber(AudioTranscriber):
         else:
             return PresetConfigs.balanced()
 
+    @property
+    def anti_hallucination_config(self) -> AntiHallucinationConfig:
+        return self._config
+
+    @anti_hallucination_config.setter
+    def anti_hallucination_config(self, config: Union[AntiHallucinationConfig, str]) -> None:
+        """Swap the configuration (object or preset name) but keep the loaded model, e.g. to compare presets."""
+        self._config = self._initialize_config(config, None, None, None, None)
+        self._custom_config_provided = True
+
     def _build_portuguese_prompt(self) -> str:
+        """Return the Portuguese prompt, building it on first use; it only depends on the vocabulary."""
+        if self._cached_portuguese_prompt is None:
+            self._cached_portuguese_prompt = self._compute_portuguese_prompt()
+        return self._cached_portuguese_prompt
+
+    def _compute_portuguese_prompt(self) -> str:
         """Build optimized prompt for Portuguese compound and religious terms."""
         base_prompt = "Transcrição em português brasileiro."
         
@@ -125,20 +341,61 @@ class WhisperAudioTranscriber(AudioTranscriber):
         
         return base_prompt
 
-    def _get_vad_model(self):
-        """Load Silero VAD model for voice activity detection."""
-        if self._vad_model is None:
+    def _get_audio_duration(self, audio: Union[str, np.ndarray]) -> float:
+        """Read the duration from the file header once per file version, without decoding the audio."""
+        if isinstance(audio, np.ndarray):
+            return len(audio) / WHISPER_SAMPLE_RATE
+        
+        key = (audio, os.path.getmtime(audio))
+        duration = _AUDIO_DURATION_CACHE.get(key)
+        if duration is None:
             try:
+                duration = sf.info(audio).duration
+            except RuntimeError:
+                # Containers libsndfile can't read (e.g. mp4): ffprobe reads the duration from the container metadata
+                duration = self._probe_duration(audio)
+            _AUDIO_DURATION_CACHE[key] = duration
+        return duration
+
+    def _probe_duration(self, audio_path: str) -> float:
+        cmd = [
+            "ffprobe",
+            "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            audio_path
+        ]
+        try:
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, text=True)
+            return float(result.stdout.strip())
+        except (OSError, subprocess.CalledProcessError, ValueError) as e:
+            # Last resort: decode the file (slow, but it's what transcription will do anyway)
+            logger().warning(f"Could not get audio duration using ffprobe, decoding the file instead. Error: {e}")
+            return len(self._load_audio(audio_path)) / WHISPER_SAMPLE_RATE
+
+    @classmethod
+    def _load_vad_cls(cls) -> Tuple[Any, Any]:
+        """Load the Silero VAD model once per process; torch.hub re-instantiates it on every call otherwise."""
+        with cls._VAD_LOCK:
+            if cls._VAD_SINGLETON is None:
                 import torch
                 torch.set_num_threads(1)  # Optimize for single-threaded use
                 
-                # Try to load Silero VAD model
                 model, utils = torch.hub.load(
                     repo_or_dir='snakers4/silero-vad',
                     model='silero_vad',
                     force_reload=False,
                     onnx=False
                 )
+                cls._VAD_SINGLETON = (model, utils)
+        
+        return cls._VAD_SINGLETON
+
+    def _get_vad_model(self):
+        """Load Silero VAD model for voice activity detection."""
+        if self._vad_model is None:
+            try:
+                model, utils = self._load_vad_cls()
                 self._vad_model = model
                 self._vad_utils = utils
                 logger().debug("Silero VAD model loaded successfully")
@@ -148,93 +405,92 @@ class WhisperAudioTranscriber(AudioTranscriber):
         
         return self._vad_model
 
-    def _detect_speech_segments_vad(self, audio_path: str) -> List[Tuple[float, float]]:
-        """Detect speech segments using VAD to avoid transcribing silence/noise."""
+    def _detect_speech_segments_vad(self, audio_path: str,
+                                    audio_array: Optional[np.ndarray] = None) -> List[Tuple[float, float]]:
+        """Detect speech segments using VAD to avoid transcribing silence/noise.
+        
+        `audio_array` is the already decoded 16kHz audio of `audio_path`; it is loaded if not given.
+        """
         try:
             vad_model = self._get_vad_model()
             
             if vad_model == "energy":
-                return self._detect_speech_segments_energy(audio_path)
+                return self._detect_speech_segments_energy(audio_path, audio_array=audio_array)
             
-            # Load audio for VAD
-            audio, sample_rate = librosa.load(audio_path, sr=16000)
-            
-            # Silero VAD expects specific sample rate
-            if sample_rate != 16000:
-                audio = librosa.resample(audio, orig_sr=sample_rate, target_sr=16000)
-                sample_rate = 16000
+            # Load audio for VAD (Silero VAD expects 16kHz)
+            audio = audio_array if audio_array is not None else self._load_audio(audio_path)
+            sample_rate = WHISPER_SAMPLE_RATE
             
             # Convert to tensor
             import torch
             audio_tensor = torch.from_numpy(audio).float()
             
-            # Get speech timestamps
-            speech_timestamps = self._vad_utils[0](
-                audio_tensor, vad_model, sampling_rate=sample_rate
-            )
-            
-            # Convert to time segments
-            segments = []
-            for timestamp in speech_timestamps:
-                start_time = timestamp['start'] / sample_rate
-                end_time = timestamp['end'] / sample_rate
-                
-                # Merge very close segments (within 0.5 seconds)
-                if segments and start_time - segments[-1][1] < 0.5:
-                    segments[-1] = (segments[-1][0], end_time)
-                else:
-                    segments.append((start_time, end_time))
+            # Get per-window speech probabilities and turn them into time segments,
+            # dropping blips shorter than 250ms and merging segments within 0.5 seconds
+            probabilities = self._get_vad_speech_probabilities(vad_model, audio_tensor, sample_rate)
+            speech_windows = _hysteresis_flags(probabilities, VAD_THRESHOLD, VAD_NEG_THRESHOLD)
+            total_duration = len(audio) / sample_rate
+            speech = _scan_speech_segments(speech_windows, VAD_WINDOW_SIZE, sample_rate, total_duration, 0.25, 0.5)
+            # Pad so chunks don't start right on the first speech window and clip word onsets
+            # (merged segments are 0.5s+ apart, so the padding can't make them overlap)
+            speech = np.clip(speech + np.array([-VAD_SPEECH_PAD, VAD_SPEECH_PAD]), 0.0, total_duration)
+            segments = [(float(start), float(end)) for start, end in speech]
             
             logger().debug(f"VAD detected {len(segments)} speech segments")
             return segments
             
         except Exception as e:
             logger().warning(f"VAD processing failed: {e}. Using energy-based fallback.")
-            return self._detect_speech_segments_energy(audio_path)
+            return self._detect_speech_segments_energy(audio_path, audio_array=audio_array)
 
-    def _detect_speech_segments_energy(self, audio_path: str) -> List[Tuple[float, float]]:
+    def _get_vad_speech_probabilities(self, vad_model: Any, audio_tensor: Any, sample_rate: int) -> np.ndarray:
+        """Speech probability for every 512-sample window, evaluated in batches (on GPU when available)."""
+        import torch
+        device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        
+        num_windows = -(-len(audio_tensor) // VAD_WINDOW_SIZE)
+        batch_size = max(1, min(VAD_BATCH_SIZE, num_windows))
+        steps = -(-num_windows // batch_size)
+        padded = torch.zeros(batch_size * steps * VAD_WINDOW_SIZE)
+        padded[:len(audio_tensor)] = audio_tensor
+        
+        # Each batch row is a contiguous stretch of the audio, so the model's recurrent
+        # state still flows window by window within a row
+        streams = padded.view(batch_size, steps, VAD_WINDOW_SIZE).to(device)
+        probabilities = torch.empty(batch_size, steps)
+        
+        # The model is shared by every transcriber in the process, and its state belongs to one stream at a time
+        with self._VAD_LOCK:
+            vad_model.to(device)
+            vad_model.reset_states()
+            with torch.no_grad():
+                for step in range(steps):
+                    probabilities[:, step] = vad_model(streams[:, step].contiguous(), sample_rate).reshape(-1).cpu()
+            vad_model.reset_states()
+        
+        return probabilities.reshape(-1)[:num_windows].numpy()
+
+    def _detect_speech_segments_energy(self, audio_path: str,
+                                       audio_array: Optional[np.ndarray] = None) -> List[Tuple[float, float]]:
         """Fallback energy-based speech detection."""
         try:
-            audio, sr = librosa.load(audio_path, sr=16000)
+            audio = audio_array if audio_array is not None else self._load_audio(audio_path)
+            sr = WHISPER_SAMPLE_RATE
             
             # Calculate energy in short windows
             hop_length = int(0.1 * sr)  # 100ms windows
-            energy = np.array([
-                np.sum(audio[i:i+hop_length]**2) 
-                for i in range(0, len(audio)-hop_length, hop_length)
-            ])
+            num_frames = len(range(0, len(audio) - hop_length, hop_length))
+            energy = np.sum(audio[:num_frames * hop_length].reshape(num_frames, hop_length) ** 2, axis=1)
             
             # Adaptive threshold based on energy distribution
             energy_threshold = np.percentile(energy, 30)
             
-            # Find speech segments
+            # Find speech segments, skipping very short ones (<0.3s) and merging those less than 1s apart
             speech_frames = energy > energy_threshold
-            segments = []
-            
-            start = None
-            for i, is_speech in enumerate(speech_frames):
-                time = i * hop_length / sr
-                
-                if is_speech and start is None:
-                    start = time
-                elif not is_speech and start is not None:
-                    segments.append((start, time))
-                    start = None
-            
-            # Close final segment if needed
-            if start is not None:
-                segments.append((start, len(audio) / sr))
-            
-            # Merge close segments and filter short ones
-            merged_segments = []
-            for start, end in segments:
-                if end - start < 0.3:  # Skip very short segments
-                    continue
-                    
-                if merged_segments and start - merged_segments[-1][1] < 1.0:
-                    merged_segments[-1] = (merged_segments[-1][0], end)
-                else:
-                    merged_segments.append((start, end))
+            merged_segments = [
+                (float(start), float(end))
+                for start, end in _scan_speech_segments(speech_frames, hop_length, sr, len(audio) / sr, 0.3, 1.0)
+            ]
             
             logger().debug(f"Energy-based VAD detected {len(merged_segments)} speech segments")
             return merged_segments
@@ -242,66 +498,35 @@ class WhisperAudioTranscriber(AudioTranscriber):
         except Exception as e:
             logger().error(f"Energy-based VAD failed: {e}")
             # Return full audio as single segment if all fails
-            duration = librosa.get_duration(path=audio_path)
+            duration = self._get_audio_duration(audio_path)
             return [(0.0, duration)]
 
-    def _extract_audio_segment(self, audio_path: str, start: float, end: float) -> str:
-        """Extract audio segment and save to temporary file."""
+    def _load_audio(self, audio_path: Union[str, np.ndarray]) -> np.ndarray:
+        """Decode the whole audio file once as 16kHz mono float32, the format Whisper expects."""
+        if isinstance(audio_path, np.ndarray):
+            return np.asarray(audio_path, dtype=np.float32)
+        
         try:
-            audio, sr = librosa.load(audio_path, sr=None, offset=start, duration=end-start)
-            
-            # Create temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-            temp_path = temp_file.name
-            temp_file.close()
-            
-            # Save segment
-            import soundfile as sf
-            sf.write(temp_path, audio, sr)
-            
-            return temp_path
+            try:
+                audio, sr = sf.read(audio_path, dtype='float32')
+            except RuntimeError:
+                # Containers libsndfile can't read (e.g. mp4) still go through librosa/audioread
+                import librosa
+                audio, _ = librosa.load(audio_path, sr=WHISPER_SAMPLE_RATE)
+                return audio
             
+            if audio.ndim > 1:
+                audio = audio.mean(axis=1)
+            if sr != WHISPER_SAMPLE_RATE:
+                audio = soxr.resample(audio, sr, WHISPER_SAMPLE_RATE)
+            return audio
+
         except Exception as e:
-            logger().error(f"Failed to extract audio segment: {e}")
+            logger().error(f"Failed to load audio: {e}")
             raise
 
-
     def _post_process_portuguese_compounds(self, document: Document) -> Document:
         """Post-process document to fix Portuguese compound word splitting."""
-        # Common Portuguese compound word patterns
-        compound_patterns = {
-            # Reflexive verbs - most common issue
-            r'\b(\w+)\s+se\b': r'\1-se',
-            r'\b(\w+)\s+me\b': r'\1-me', 
-            r'\b(\w+)\s+te\b': r'\1-te',
-            r'\b(\w+)\s+nos\b': r'\1-nos',
-            r'\b(\w+)\s+lhe\b': r'\1-lhe',
-            r'\b(\w+)\s+lhes\b': r'\1-lhes',
-            
-            # Common prefixes split incorrectly
-            r'\bbem\s+(\w+)': r'bem-\1',
-            r'\bmal\s+(\w+)': r'mal-\1',
-            r'\bauto\s+(\w+)': r'auto-\1',
-            r'\banti\s+(\w+)': r'anti-\1',
-            r'\bpós\s+(\w+)': r'pós-\1',
-            r'\bpré\s+(\w+)': r'pré-\1',
-            r'\bsobre\s+(\w+)': r'sobre-\1',
-            r'\bsub\s+(\w+)': r'sub-\1',
-        }
-        
-        # Specific religious/biblical terms that get misrecognized
-        religious_corrections = {
-            "jet semany": "Getsêmani",
-            "jet sê mani": "Getsêmani", 
-            "get semany": "Getsêmani",
-            "jets emany": "Getsêmani",
-            "jet semani": "Getsêmani",
-            "bem aventurança": "bem-aventurança",
-            "bem aventurado": "bem-aventurado",
-            "cruz sagrada": "cruz-sagrada",
-            "pós ressurreição": "pós-ressurreição",
-        }
-
         # Process each segment
         for segment in document.segments:
             for line in segment.lines:
@@ -310,13 +535,13 @@ class WhisperAudioTranscriber(AudioTranscriber):
                 full_line_text = " ".join(words_text)
                 
                 # Apply religious/biblical corrections first (case insensitive)
-                corrected_text = full_line_text
-                for incorrect, correct in religious_corrections.items():
-                    corrected_text = re.sub(re.escape(incorrect), correct, corrected_text, flags=re.IGNORECASE)
+                corrected_text = _RELIGIOUS_PATTERN.sub(
+                    lambda m: _RELIGIOUS_REPLACEMENTS[int(m.lastgroup[1:])], full_line_text
+                )
                 
-                # Apply compound word patterns
-                for pattern, replacement in compound_patterns.items():
-                    corrected_text = re.sub(pattern, replacement, corrected_text, flags=re.IGNORECASE)
+                # Apply compound word patterns: reflexive verbs (most common issue) and split prefixes
+                corrected_text = _REFLEXIVE_PATTERN.sub(lambda m: f"{m.group(1)}-{m.group(2).lower()}", corrected_text)
+                corrected_text = _PREFIX_PATTERN.sub(lambda m: f"{m.group(1).lower()}-{m.group(2)}", corrected_text)
                 
                 # If text changed, update words
                 if corrected_text != full_line_text:
@@ -330,14 +555,17 @@ class WhisperAudioTranscriber(AudioTranscriber):
         
         return document
 
-    def transcribe(self, audio_path: str) -> Document:
+    def transcribe(self, audio_path: Union[str, np.ndarray]) -> Document:
         """
         Transcribes the audio file and returns segments with timestamps.
         Uses chunking and VAD for long videos to prevent hallucinations.
+
+        `audio_path` may also be already decoded 16kHz mono float32 audio, so the same
+        audio can be transcribed several times (e.g. with different configs) without decoding it again.
         """
         try:
             # Get audio duration and set up duration-based config if needed
-            duration = librosa.get_duration(path=audio_path)
+            duration = self._get_audio_duration(audio_path)
             
             # Use duration-based configuration if no specific config was provided
             if not hasattr(self, '_duration_config_applied') and not hasattr(self, '_custom_config_provided'):
@@ -358,18 +586,71 @@ class WhisperAudioTranscriber(AudioTranscriber):
             # Fallback to single transcription
             return self._transcribe_single(audio_path)
 
-    def _transcribe_chunked(self, audio_path: str) -> Document:
+    def preload(self) -> Future:
+        """
+        Starts loading (and, on first use, downloading) the Whisper model and the VAD model in the background,
+        so the first transcribe() call doesn't wait for them. The returned future completes once both are ready.
+        
+        This loads `model_size` as given: a transcribe() started meanwhile waits for it and uses it, instead of
+        loading the duration-optimal model too.
+        """
+        def load_models():
+            self._get_model()
+            if self._config.enable_vad:
+                self._get_vad_model()
+        
+        return self._executor.submit(load_models)
+
+    def transcribe_with_configs(self, audio_path: Union[str, np.ndarray],
+                                configs: List[Union[AntiHallucinationConfig, str]]) -> List[Document]:
+        """
+        Transcribes the same audio once per anti-hallucination config (object or preset name).
+        The audio is decoded and the model loaded only once; the current config is restored afterwards.
+        """
+        audio = self._load_audio(audio_path)
+        original_config = self._config
+        had_custom_config = hasattr(self, '_custom_config_provided')
+        
+        documents = []
+        try:
+            for config in configs:
+                self.anti_hallucination_config = config
+                documents.append(self.transcribe(audio))
+        finally:
+            self._config = original_config
+            if not had_custom_config and hasattr(self, '_custom_config_provided'):
+                del self._custom_config_provided
+        
+        return documents
+
+    def _transcribe_chunked(self, audio_path: Union[str, np.ndarray]) -> Document:
         """Transcribe long audio using overlapping chunks with VAD preprocessing."""
         try:
             # Get audio duration and adaptive thresholds
-            duration = librosa.get_duration(path=audio_path)
+            duration = self._get_audio_duration(audio_path)
             whisper_params = self._config.get_whisper_params(duration)
             
+            # A single chunk would cover everything, so VAD and chunk planning would be wasted work
+            if duration <= self._config.chunk_length + self._config.overlap:
+                return self._transcribe_single(audio_path)
+            
             logger().debug(f"Transcribing {duration:.1f}s audio with chunking. Thresholds: {whisper_params}")
             
-            # Use VAD to detect speech segments if enabled
+            # Decode once; VAD and every chunk slice share this array instead of re-reading the file
+            audio = self._load_audio(audio_path)
+            
+            # Run VAD in the background while the Whisper model loads; both take seconds on first call
+            vad_future = None
             if self._config.enable_vad:
-                speech_segments = self._detect_speech_segments_vad(audio_path)
+                vad_future = self._executor.submit(self._detect_speech_segments_vad, audio_path, audio_array=audio)
+            
+            # Load the model up front so worker threads don't race to load it, picking it from the
+            # duration (chunks are in-memory slices, so the workers can't select it from the file)
+            self._get_model(duration=duration)
+            
+            # Use VAD to detect speech segments if enabled
+            if vad_future is not None:
+                speech_segments = vad_future.result()
                 logger().debug(f"VAD detected {len(speech_segments)} speech segments")
             else:
                 # Use full duration if VAD disabled
@@ -378,34 +659,27 @@ class WhisperAudioTranscriber(AudioTranscriber):
             # Create chunks from speech segments
             chunks = self._create_chunks_from_speech_segments(speech_segments, duration)
             
-            # Transcribe each chunk
-            all_documents = []
-            temp_files = []
-            
-            for i, (start, end) in enumerate(chunks):
-                logger().debug(f"Processing chunk {i+1}/{len(chunks)}: {start:.1f}s - {end:.1f}s")
-                
-                # Extract audio segment
-                chunk_path = self._extract_audio_segment(audio_path, start, end)
-                temp_files.append(chunk_path)
+            # Transcribe chunks concurrently; they share no state (condition_on_previous_text=False)
+            with ThreadPoolExecutor(max_workers=self._config.num_workers) as executor:
+                futures = []
+                for start, end in chunks:
+                    chunk_audio = audio[int(start * WHISPER_SAMPLE_RATE):int(end * WHISPER_SAMPLE_RATE)]
+                    futures.append(executor.submit(self._transcribe_single, chunk_audio, time_offset=start, **whisper_params))
                 
-                try:
-                    # Transcribe chunk with adaptive thresholds
-                    chunk_doc = self._transcribe_single(chunk_path, time_offset=start, **whisper_params)
-                    all_documents.append(chunk_doc)
-                except Exception as e:
-                    logger().warning(f"Failed to transcribe chunk {i+1}: {e}")
-                    continue
-            
-            # Clean up temporary files
-            for temp_file in temp_files:
-                try:
-                    os.unlink(temp_file)
-                except Exception:
-                    pass
+                all_documents = []
+                transcribed_chunks = []
+                for i, future in enumerate(futures):
+                    start, end = chunks[i]
+                    logger().debug(f"Processing chunk {i+1}/{len(chunks)}: {start:.1f}s - {end:.1f}s")
+                    try:
+                        all_documents.append(future.result())
+                        transcribed_chunks.append(chunks[i])
+                    except Exception as e:
+                        logger().warning(f"Failed to transcribe chunk {i+1}: {e}")
+                        continue
             
             # Merge documents with overlap deduplication
-            return self._merge_chunked_documents(all_documents, chunks)
+            return self._merge_chunked_documents(all_documents, transcribed_chunks)
             
         except Exception as e:
             logger().warning(f"Chunked transcription failed: {e}. Falling back to single transcription.")
@@ -413,50 +687,45 @@ class WhisperAudioTranscriber(AudioTranscriber):
 
     def _create_chunks_from_speech_segments(self, speech_segments: List[Tuple[float, float]], 
                                           total_duration: float) -> List[Tuple[float, float]]:
-        """Create overlapping chunks from speech segments."""
-        chunks = []
+        """Create overlapping chunks, at most chunk_length long, that cover every speech segment."""
+        chunk_length = self._config.chunk_length
+        if chunk_length <= 0:
+            return [(0.0, total_duration)]
+        overlap = min(self._config.overlap, chunk_length / 2)
+        step = chunk_length - overlap
         
         if not speech_segments:
             # Fallback to time-based chunking
-            current_start = 0
-            while current_start < total_duration:
-                chunk_end = min(current_start + self._config.chunk_length, total_duration)
-                chunks.append((current_start, chunk_end))
-                current_start += self._config.chunk_length - self._config.overlap
-            return chunks
-        
-        # Create chunks that respect speech boundaries
-        current_start = 0
-        
-        for start, end in speech_segments:
-            # If there's a gap before this speech segment and we need to start a new chunk
-            if start > current_start + self._config.chunk_length:
-                # Create chunk up to previous speech
-                if current_start < start:
-                    chunks.append((current_start, min(current_start + self._config.chunk_length, start)))
-                current_start = start
-            
-            # If this speech segment is very long, split it
-            segment_start = max(current_start, start)
-            while segment_start < end:
-                chunk_end = min(segment_start + self._config.chunk_length, end, total_duration)
-                chunks.append((segment_start, chunk_end))
-                
-                # Move to next chunk with overlap
-                segment_start = chunk_end - self._config.overlap
-                if segment_start >= chunk_end:
-                    break
-            
-            current_start = max(current_start, end - self._config.overlap)
+            speech_segments = [(0.0, total_duration)]
+        speech = np.clip(np.array(sorted(speech_segments), dtype=np.float64).reshape(-1, 2), 0.0, total_duration)
+        
+        # Merge overlapping speech segments
+        running_ends = np.maximum.accumulate(speech[:, 1])
+        is_new = np.r_[True, speech[1:, 0] > running_ends[:-1]]
+        merged_starts = speech[is_new, 0]
+        merged_ends = running_ends[np.r_[np.flatnonzero(is_new)[1:] - 1, len(speech) - 1]]
         
-        # Handle remaining audio
-        if current_start < total_duration:
-            chunks.append((current_start, total_duration))
+        # Split segments longer than chunk_length into pieces that overlap by `overlap` seconds
+        pieces = np.maximum(1, np.ceil((merged_ends - merged_starts - overlap) / step)).astype(np.int64)
+        owner = np.repeat(np.arange(len(pieces)), pieces)
+        piece_index = np.arange(pieces.sum()) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+        piece_starts = merged_starts[owner] + piece_index * step
+        piece_ends = np.minimum(piece_starts + chunk_length, merged_ends[owner])
+        
+        # Pack consecutive short pieces together so each chunk is as close to chunk_length as possible
+        chunks = []
+        i = 0
+        while i < len(piece_starts):
+            j = max(int(np.searchsorted(piece_ends, piece_starts[i] + chunk_length, side='right')), i + 1)
+            chunks.append((float(piece_starts[i]), float(piece_ends[j - 1])))
+            i = j
         
         return chunks
 
-    def _transcribe_single(self, audio_path: str, time_offset: float = 0.0, **whisper_params) -> Document:
-        """Transcribe a single audio file or chunk."""
+    def _transcribe_single(self, audio: Union[str, np.ndarray], time_offset: float = 0.0, **whisper_params) -> Document:
+        """Transcribe a single audio file, or an in-memory 16kHz chunk of one."""
+        audio_path = audio if isinstance(audio, str) else None
+
         # Build appropriate prompt for Portuguese optimization
         prompt = self._initial_prompt
         if not prompt and (self._language == "pt" or not self._language):
@@ -465,7 +734,7 @@ class WhisperAudioTranscriber(AudioTranscriber):
         # Get duration for adaptive thresholds if not provided
         if not whisper_params:
             try:
-                duration = librosa.get_duration(path=audio_path)
+                duration = self._get_audio_duration(audio)
                 whisper_params = self._config.get_whisper_params(duration)
             except Exception:
                 whisper_params = {
@@ -475,18 +744,7 @@ class WhisperAudioTranscriber(AudioTranscriber):
                 }
         
         # Enhanced Whisper parameters for better accuracy and repetition prevention
-        result = self._get_model(audio_path).transcribe(
-            audio_path,
-            word_timestamps=True,
-            language=self._language,
-            verbose=False,
-            initial_prompt=prompt,
-            temperature=0.0,  # More deterministic output
-            condition_on_previous_text=False,  # Prevent repetition loops
-            suppress_tokens=[-1],  # Suppress no speech token
-            without_timestamps=False,
-            **whisper_params
-        )
+        result = self._run_model(self._get_model(audio_path), audio, prompt, whisper_params)
 
         if "segments" not in result or not result["segments"]:
             logger().warning("Whisper returned no segments in the transcription.")
@@ -495,33 +753,33 @@ class WhisperAudioTranscriber(AudioTranscriber):
         logger().debug(f"Whisper result for chunk: {len(result['segments'])} segments")
         document = Document()
         
-        for segment_info in result["segments"]:
-            segment_start = float(segment_info["start"]) + time_offset
-            segment_end = float(segment_info["end"]) + time_offset
-            if segment_start == segment_end:
-                segment_end = segment_start + 0.01
-            segment_time = TimeFragment(start=segment_start, end=segment_end)
+        segments_info = result["segments"]
+        # Ensure 'word' is a string, sometimes Whisper might return non-string for certain symbols.
+        segment_words = [
+            [(text, word_entry) for word_entry in segment_info["words"] if (text := str(word_entry["word"]).strip())]
+            if "words" in segment_info and isinstance(segment_info["words"], list) else None
+            for segment_info in segments_info
+        ]
+        all_words = [entry for words in segment_words if words for entry in words]
+        segment_starts, segment_ends = self._to_time_arrays(segments_info, time_offset)
+        word_starts, word_ends = self._to_time_arrays([word_entry for _, word_entry in all_words], time_offset)
+        
+        word_index = 0
+        for i, segment_info in enumerate(segments_info):
+            segment_time = TimeFragment(start=segment_starts[i], end=segment_ends[i])
             segment = Segment(time=segment_time)
             line = Line(time=segment_time)
             segment.lines.add(line)
 
-            if not "words" in segment_info or not isinstance(segment_info["words"], list):
+            words = segment_words[i]
+            if words is None:
                 logger().debug(f"Segment '{segment_info['text']}' has no detailed word data.")
                 continue
 
-            for word_entry in segment_info["words"]:
-                # Ensure 'word' is a string, sometimes Whisper might return non-string for certain symbols.
-                word_text = str(word_entry["word"]).strip()
-                if not word_text:
-                    continue
-
-                word_start = float(word_entry["start"]) + time_offset
-                word_end = float(word_entry["end"]) + time_offset
-                if word_start == word_end:
-                    word_end = word_start + 0.01
-                word_time = TimeFragment(start=word_start, end=word_end)
-                word = Word(text=word_text, time=word_time)
-                line.words.add(word)
+            for word_text, _ in words:
+                word_time = TimeFragment(start=word_starts[word_index], end=word_ends[word_index])
+                line.words.add(Word(text=word_text, time=word_time))
+                word_index += 1
 
             document.segments.add(segment)
         
@@ -539,6 +797,58 @@ class WhisperAudioTranscriber(AudioTranscriber):
 
         return document
 
+    @staticmethod
+    def _to_time_arrays(entries: List[Dict[str, Any]], time_offset: float) -> Tuple[List[float], List[float]]:
+        """Offset the start/end times of Whisper entries, widening zero-length ones to MIN_TIME_FRAGMENT."""
+        starts = np.fromiter((entry["start"] for entry in entries), dtype=np.float64, count=len(entries)) + time_offset
+        ends = np.fromiter((entry["end"] for entry in entries), dtype=np.float64, count=len(entries)) + time_offset
+        ends = np.where(ends == starts, starts + MIN_TIME_FRAGMENT, ends)
+        return starts.tolist(), ends.tolist()
+
+    def _run_model(self, model: Any, audio: Union[str, np.ndarray], prompt: Optional[str],
+                   whisper_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the backend model and return an openai-whisper style result dict."""
+        if self._backend == "openai":
+            with self._OPENAI_DECODE_LOCK:
+                return model.transcribe(
+                    audio,
+                    word_timestamps=True,
+                    language=self._language,
+                    verbose=False,
+                    initial_prompt=prompt,
+                    temperature=0.0,  # More deterministic output
+                    condition_on_previous_text=False,  # Prevent repetition loops
+                    suppress_tokens=[-1],  # Suppress no speech token
+                    without_timestamps=False,
+                    **whisper_params
+                )
+
+        segments, _ = model.transcribe(
+            audio,
+            word_timestamps=True,
+            vad_filter=False,  # Speech detection already happens in _detect_speech_segments_vad
+            language=self._language,
+            initial_prompt=prompt,
+            temperature=0.0,
+            condition_on_previous_text=False,
+            suppress_tokens=[-1],
+            without_timestamps=False,
+            compression_ratio_threshold=whisper_params['compression_ratio_threshold'],
+            log_prob_threshold=whisper_params['logprob_threshold'],
+            no_speech_threshold=whisper_params['no_speech_threshold'],
+        )
+        return {
+            "segments": [
+                {
+                    "start": segment.start,
+                    "end": segment.end,
+                    "text": segment.text,
+                    "words": [{"word": w.word, "start": w.start, "end": w.end} for w in segment.words or []],
+                }
+                for segment in segments
+            ]
+        }
+
     def _merge_chunked_documents(self, documents: List[Document], chunks: List[Tuple[float, float]]) -> Document:
         """Merge chunked documents while handling overlaps."""
         if not documents:
@@ -547,38 +857,33 @@ class WhisperAudioTranscriber(AudioTranscriber):
         if len(documents) == 1:
             return documents[0]
         
+        segments = [segment for doc in documents for segment in doc.segments]
         merged = Document()
+        if not segments:
+            return merged
         
-        for i, doc in enumerate(documents):
-            chunk_start, chunk_end = chunks[i]
-            
-            for segment in doc.segments:
-                # For overlapping regions, only keep content from the first chunk that contains it
-                segment_mid = (segment.time.start + segment.time.end) / 2
-                
-                # Check if this segment overlaps with previous chunks
-                should_include = True
-                if i > 0:
-                    prev_chunk_start, prev_chunk_end = chunks[i-1]
-                    overlap_start = max(chunk_start, prev_chunk_end - self._config.overlap)
-                    
-                    # If segment is in overlap region, check if it's closer to current chunk center
-                    if overlap_start <= segment_mid <= chunk_start + self._config.overlap:
-                        chunk_center = (chunk_start + chunk_end) / 2
-                        prev_chunk_center = (prev_chunk_start + prev_chunk_end) / 2
-                        
-                        # Keep segment in chunk it's closer to center of
-                        if abs(segment_mid - prev_chunk_center) <= abs(segment_mid - chunk_center):
-                            should_include = False
-                
-                if should_include:
-                    merged.segments.add(segment)
+        source_chunk = np.repeat(np.arange(len(documents)), [len(doc.segments) for doc in documents])
+        segment_mids = np.array([(segment.time.start + segment.time.end) / 2 for segment in segments])
+        chunk_bounds = np.asarray(chunks, dtype=np.float64)
+        chunk_starts = chunk_bounds[source_chunk, 0]
+        chunk_centers = chunk_bounds[source_chunk].mean(axis=1)
+        # Bounds of the previous chunk, for every segment (segments of the first chunk are always kept)
+        prev_bounds = chunk_bounds[np.maximum(source_chunk - 1, 0)]
+        prev_centers = prev_bounds.mean(axis=1)
+        
+        # For overlapping regions, a later chunk drops the segments that are at least as close to the previous
+        # chunk's center as to its own; the previous chunk keeps its copy, so nothing is dropped twice.
+        # Chunks packed from speech pieces can have silent gaps between them, so the previous chunk
+        # must actually cover the segment for it to be in the overlap.
+        overlap_starts = np.maximum(chunk_starts, prev_bounds[:, 1] - self._config.overlap)
+        in_overlap = ((source_chunk > 0) & (overlap_starts <= segment_mids)
+                      & (segment_mids <= chunk_starts + self._config.overlap) & (segment_mids <= prev_bounds[:, 1]))
+        closer_to_prev = np.abs(segment_mids - prev_centers) <= np.abs(segment_mids - chunk_centers)
+        keep = ~(in_overlap & closer_to_prev)
         
         # Sort segments by start time
-        sorted_segments = sorted(merged.segments, key=lambda s: s.time.start)
-        merged.segments.clear()
-        for segment in sorted_segments:
-            merged.segments.add(segment)
+        kept_segments = sorted((segments[i] for i in np.flatnonzero(keep)), key=lambda s: s.time.start)
+        merged.segments.extend(kept_segments)
         
         logger().debug(f"Merged {len(documents)} chunks into {len(merged.segments)} segments")
         return merged
@@ -589,76 +894,49 @@ class WhisperAudioTranscriber(AudioTranscriber):
             return document
         
         # Track patterns and their frequency
-        segment_texts = []
-        segment_compressions = []
+        segment_texts = [
+            ' '.join(word.text for line in segment.lines for word in line.words).strip()
+            for segment in document.segments
+        ]
+        lowered_texts = [text.lower() for text in segment_texts]
+        count = len(segment_texts)
+        text_lengths = np.fromiter((len(text) for text in segment_texts), dtype=np.int32, count=count)
+        byte_lengths = np.fromiter((len(text.encode('utf-8')) for text in segment_texts), dtype=np.int32, count=count)
+        word_counts = np.fromiter((len(text.split()) for text in segment_texts), dtype=np.int32, count=count)
         
-        for segment in document.segments:
-            text = ' '.join([word.text for line in segment.lines for word in line.words])
-            segment_texts.append(text.strip())
-            
-            # Calculate compression ratio (text length vs expected length)
-            words = text.split()
-            expected_length = len(words) * 5  # Average word length estimate
-            compression_ratio = len(text.encode('utf-8')) / max(expected_length, 1)
-            segment_compressions.append(compression_ratio)
+        # Calculate compression ratio (text length vs expected length, using ~5 chars per word)
+        segment_compressions = byte_lengths / np.maximum(word_counts * 5, 1)
         
         to_remove = set()
         
-        # 1. Check for exact repetition patterns (enhanced)
-        for i in range(len(segment_texts) - 1):
-            current_text = segment_texts[i]
-            
-            # Skip very short segments
-            if len(current_text) < 5:
-                continue
-            
-            # Count consecutive identical segments
-            consecutive_count = 1
-            j = i + 1
-            while j < len(segment_texts) and segment_texts[j] == current_text:
-                consecutive_count += 1
-                j += 1
-            
-            # Remove excessive repetitions (keep first 2 max)
-            if consecutive_count > 2:
-                for k in range(i + 2, i + consecutive_count):
-                    to_remove.add(k)
-                logger().debug(f"Found {consecutive_count} consecutive identical segments: '{current_text[:50]}...'")
+        # 1. Check for exact repetition patterns (enhanced): runs of consecutive identical segments
+        texts_array = np.asarray(segment_texts, dtype=object)
+        run_starts = np.flatnonzero(np.r_[True, texts_array[1:] != texts_array[:-1]])
+        run_lengths = np.diff(np.r_[run_starts, count])
+        
+        for start, consecutive_count in zip(run_starts.tolist(), run_lengths.tolist()):
+            # Skip very short segments; remove excessive repetitions (keep first 2 max)
+            if consecutive_count > 2 and text_lengths[start] >= 5:
+                to_remove.update(range(start + 2, start + consecutive_count))
+                logger().debug(f"Found {consecutive_count} consecutive identical segments: '{segment_texts[start][:50]}...'")
         
         # 2. Check for high compression ratio (likely hallucination)
         compression_threshold = 4.0  # Empirically determined
-        for i, compression in enumerate(segment_compressions):
-            if compression > compression_threshold and len(segment_texts[i]) > 20:
-                to_remove.add(i)
-                logger().debug(f"Removing high compression segment {i} (ratio: {compression:.2f}): '{segment_texts[i][:50]}...'")
+        high_compression = (segment_compressions > compression_threshold) & (text_lengths > 20)
+        for i in np.flatnonzero(high_compression).tolist():
+            to_remove.add(i)
+            logger().debug(f"Removing high compression segment {i} (ratio: {segment_compressions[i]:.2f}): '{segment_texts[i][:50]}...'")
         
-        # 3. Check for semantic repetition (similar meaning)
-        self._detect_semantic_repetition(segment_texts, to_remove)
+        # 3. Check for semantic repetition (similar meaning); it only compares segments of 20+ characters
+        if np.count_nonzero(text_lengths >= 20) >= 2:
+            self._detect_semantic_repetition(segment_texts, lowered_texts, to_remove)
         
         # 4. Check for specific repetitive phrases (existing logic enhanced)
-        repetitive_phrases = [
-            "E aí ele falou, ó, eu sou gay",
-            "ele falou, ó, eu sou gay", 
-            "aí ele falou, ó, eu sou gay",
-            "você pode me ajudar",
-            "muito obrigado",
-            "por favor",
-        ]
+        self._detect_repetitive_phrases(segment_texts, lowered_texts, to_remove)
         
-        for i, text in enumerate(segment_texts):
-            for phrase in repetitive_phrases:
-                if phrase.lower() in text.lower() and len(text) < len(phrase) + 15:
-                    # Count occurrences across entire document
-                    count = sum(1 for t in segment_texts if phrase.lower() in t.lower() and len(t) < len(phrase) + 15)
-                    if count > 3:
-                        # Keep only first 2 occurrences
-                        occurrence_count = sum(1 for j in range(i) if phrase.lower() in segment_texts[j].lower() and len(segment_texts[j]) < len(phrase) + 15)
-                        if occurrence_count >= 2:
-                            to_remove.add(i)
-                            logger().debug(f"Removing excessive repetitive phrase {i}: '{text[:50]}...'")
-        
-        # 5. Check for looping patterns (new)
-        self._detect_looping_patterns(segment_texts, to_remove)
+        # 5. Check for looping patterns (new); a pattern of 2+ segments needs room for 3+ copies of itself
+        if count >= 9:
+            self._detect_looping_patterns(segment_texts, lowered_texts, to_remove)
         
         # Create new document with filtered segments
         if to_remove:
@@ -672,74 +950,112 @@ class WhisperAudioTranscriber(AudioTranscriber):
         
         return document
 
-    def _detect_semantic_repetition(self, segment_texts: List[str], to_remove: set):
+    def _detect_semantic_repetition(self, segment_texts: List[str], lowered_texts: List[str], to_remove: set):
         """Detect semantically similar segments that might be hallucinations."""
-        from difflib import SequenceMatcher
-        
         similarity_threshold = 0.8
         min_length = 20
+        max_exhaustive_segments = 64  # Below this, comparing every pair is cheap enough
+        
+        eligible = [i for i, text in enumerate(segment_texts) if i not in to_remove and len(text) >= min_length]
+        lengths = np.fromiter((len(lowered_texts[i]) for i in eligible), dtype=np.int64, count=len(eligible))
+        if len(eligible) > max_exhaustive_segments:
+            # Only score pairs whose MinHash signatures collide in at least one LSH band
+            signatures = _minhash_signatures([lowered_texts[i] for i in eligible])
+            buckets = defaultdict(list)
+            for row in range(len(eligible)):
+                for band in range(MINHASH_BANDS):
+                    band_signature = signatures[row, band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS].tobytes()
+                    buckets[(band, band_signature)].append(row)
+            
+            colliding = set()
+            for bucket in buckets.values():
+                for k, row in enumerate(bucket[:-1]):
+                    colliding.update((row, other) for other in bucket[k + 1:])
+            pairs = np.array(sorted(colliding), dtype=np.int64).reshape(-1, 2)
+            pair_lengths = lengths[pairs]
+            pairs = pairs[2.0 * pair_lengths.min(axis=1) / pair_lengths.sum(axis=1) > similarity_threshold]
+        else:
+            pairs = _length_compatible_pairs(lengths, similarity_threshold)
         
-        for i in range(len(segment_texts)):
-            if i in to_remove or len(segment_texts[i]) < min_length:
+        # Pairs are sorted by (earlier, later), the same order as comparing every pair in turn
+        for row, other in pairs.tolist():
+            i, j = eligible[row], eligible[other]
+            if i in to_remove or j in to_remove:
                 continue
-                
-            for j in range(i + 1, len(segment_texts)):
-                if j in to_remove or len(segment_texts[j]) < min_length:
-                    continue
-                
-                # Calculate similarity
-                similarity = SequenceMatcher(None, segment_texts[i].lower(), segment_texts[j].lower()).ratio()
-                
-                if similarity > similarity_threshold:
-                    # Keep the earlier segment, remove the later one
-                    to_remove.add(j)
-                    logger().debug(f"Removing semantically similar segment {j} (similarity: {similarity:.2f})")
+            
+            # Calculate similarity
+            # Indel (normalized LCS) similarity: difflib's ratio() without its matching-block heuristics, in C
+            similarity = Indel.normalized_similarity(lowered_texts[i], lowered_texts[j])
+            
+            if similarity > similarity_threshold:
+                # Keep the earlier segment, remove the later one
+                to_remove.add(j)
+                logger().debug(f"Removing semantically similar segment {j} (similarity: {similarity:.2f})")
 
-    def _detect_looping_patterns(self, segment_texts: List[str], to_remove: set):
+    def _detect_repetitive_phrases(self, segment_texts: List[str], lowered_texts: List[str], to_remove: set):
+        """Detect known phrases Whisper loops on, keeping the first 2 of the short segments made of each."""
+        # Segments containing the phrase that are at most 14 characters longer than it, per phrase
+        occurrences = defaultdict(list)
+        for i, text in enumerate(lowered_texts):
+            for phrase, max_length in _REPETITIVE_PHRASES:
+                if phrase in text and len(segment_texts[i]) < max_length:
+                    occurrences[phrase].append(i)
+        
+        for phrase, segments in occurrences.items():
+            if len(segments) > 3:
+                # Keep only first 2 occurrences
+                for i in segments[2:]:
+                    to_remove.add(i)
+                    logger().debug(f"Removing excessive repetitive phrase {i}: '{segment_texts[i][:50]}...'")
+
+    def _detect_looping_patterns(self, segment_texts: List[str], lowered_texts: List[str], to_remove: set):
         """Detect looping patterns where the same sequence repeats."""
         min_pattern_length = 2
         max_pattern_length = 5
         
-        for pattern_length in range(min_pattern_length, min(max_pattern_length + 1, len(segment_texts) // 3)):
-            for start in range(len(segment_texts) - pattern_length * 3):
+        normalized = np.array([text.strip() for text in lowered_texts], dtype=object)
+        total = len(normalized)
+        
+        for pattern_length in range(min_pattern_length, min(max_pattern_length + 1, total // 3)):
+            num_starts = total - pattern_length * 3
+            if num_starts <= 0:
+                continue
+            required_matches = math.ceil(0.8 * pattern_length)  # 80% match threshold
+            
+            # matches[start]: how many blocks right after the pattern at `start` repeat it
+            matches = np.zeros(num_starts, dtype=np.int64)
+            repeating = np.ones(num_starts, dtype=bool)
+            repetition = 1
+            while repeating.any():
+                lag = repetition * pattern_length
+                fitting = min(num_starts, total - lag - pattern_length + 1)
+                if fitting <= 0:
+                    break
+                
+                # Number of segments in each block that equal the segment `lag` positions earlier
+                equal_counts = np.concatenate(([0], np.cumsum(normalized[:-lag] == normalized[lag:])))
+                block_matches = np.zeros(num_starts, dtype=bool)
+                block_matches[:fitting] = (equal_counts[pattern_length:pattern_length + fitting]
+                                           - equal_counts[:fitting]) >= required_matches
+                repeating &= block_matches
+                matches += repeating
+                repetition += 1
+            
+            # If pattern repeats 2+ times, remove the repetitions
+            for start in np.flatnonzero(matches >= 2).tolist():
                 if start in to_remove:
                     continue
                 
-                # Extract potential pattern
-                pattern = segment_texts[start:start + pattern_length]
+                repetitions = int(matches[start])
+                to_remove.update(range(start + pattern_length, start + (repetitions + 1) * pattern_length))
                 
-                # Check if this pattern repeats immediately after
-                matches = 0
-                pos = start + pattern_length
-                
-                while pos + pattern_length <= len(segment_texts):
-                    candidate = segment_texts[pos:pos + pattern_length]
-                    
-                    # Check if candidate matches pattern (with some tolerance)
-                    match_count = sum(1 for a, b in zip(pattern, candidate) if a.lower().strip() == b.lower().strip())
-                    match_ratio = match_count / pattern_length
-                    
-                    if match_ratio >= 0.8:  # 80% match threshold
-                        matches += 1
-                        pos += pattern_length
-                    else:
-                        break
-                
-                # If pattern repeats 2+ times, remove the repetitions
-                if matches >= 2:
-                    for rep in range(1, matches + 1):
-                        rep_start = start + rep * pattern_length
-                        for idx in range(rep_start, rep_start + pattern_length):
-                            if idx < len(segment_texts):
-                                to_remove.add(idx)
-                    
-                    pattern_text = " | ".join(p[:30] for p in pattern)
-                    logger().debug(f"Detected looping pattern (length {pattern_length}, {matches} repetitions): {pattern_text}...") 
+                pattern_text = " | ".join(p[:30] for p in segment_texts[start:start + pattern_length])
+                logger().debug(f"Detected looping pattern (length {pattern_length}, {repetitions} repetitions): {pattern_text}...") 
 
     def _get_optimal_model_for_duration(self, audio_path: str) -> str:
         """Select optimal model based on audio duration and requirements."""
         try:
-            duration = librosa.get_duration(path=audio_path)
+            duration = self._get_audio_duration(audio_path)
             return self._config.get_optimal_model(self._model_size, duration)
         except Exception:
             # If we can't determine duration, use requested model
@@ -759,14 +1075,45 @@ class WhisperAudioTranscriber(AudioTranscriber):
         
         return fallback_chains.get(preferred_model, [preferred_model, "base", "tiny"])
 
-    def _get_model(self, audio_path: str = None):
+    @classmethod
+    def unload_models(cls) -> None:
+        """Drop every cached Whisper model so its (V)RAM can be reclaimed."""
+        with cls._MODEL_CACHE_LOCK:
+            cls._MODEL_CACHE.clear()
+
+    def _load_model(self, model_name: str) -> Any:
+        key = (self._backend, model_name, self._config.num_workers)
+        with self._MODEL_CACHE_LOCK:
+            model = self._MODEL_CACHE.get(key)
+            if model is None:
+                model = self._create_model(model_name)
+                self._MODEL_CACHE[key] = model
+        return model
+
+    def _create_model(self, model_name: str) -> Any:
+        if self._backend == "openai":
+            import whisper
+            return whisper.load_model(model_name)
+
+        from faster_whisper import WhisperModel
+        # One CTranslate2 worker per chunk thread, so concurrent transcribe() calls actually run in parallel
+        return WhisperModel(model_name, num_workers=self._config.num_workers)
+
+    def _get_model(self, audio_path: str = None, duration: Optional[float] = None):
         if self._model:
             return self._model
         
-        import whisper
+        with self._model_load_lock:
+            # A concurrent call (e.g. a pending preload()) may have loaded it while we waited
+            if self._model:
+                return self._model
+            return self._load_optimal_model(audio_path, duration)
 
-        # Determine optimal model if audio path provided
-        if audio_path:
+    def _load_optimal_model(self, audio_path: Optional[str], duration: Optional[float]) -> Any:
+        # Determine optimal model if the audio duration (or audio path) is provided
+        if duration is not None:
+            optimal_model = self._config.get_optimal_model(self._model_size, duration)
+        elif audio_path:
             optimal_model = self._get_optimal_model_for_duration(audio_path)
         else:
             optimal_model = self._model_size
@@ -778,7 +1125,7 @@ class WhisperAudioTranscriber(AudioTranscriber):
         for model_name in fallback_models:
             try:
                 logger().debug(f"Attempting to load Whisper model: {model_name}")
-                self._model = whisper.load_model(model_name)
+                self._model = self._load_model(model_name)
                 
                 # Update model size for future reference
                 self._model_size = model_name
@@ -796,5 +1143,5 @@ class WhisperAudioTranscriber(AudioTranscriber):
         # If all models failed
         raise RuntimeError(
             f"Failed to load any Whisper model from chain {fallback_models}. Last error: {last_error}\n" 
-            f"Ensure Whisper is installed and models are available (or can be downloaded)."
+            f"Ensure the '{self._backend}' Whisper backend is installed and models are available (or can be downloaded)."
         )
\ No newline at end of file
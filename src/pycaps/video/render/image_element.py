@@ -19,5 +19,5 @@ class ImageElement(MediaElement):
         self._size = self._image.shape[1], self._image.shape[0]
 
     def get_frame(self, t_rel: float) -> np.ndarray:
-        # TODO: we shouldn't copy each frame... it should be copied only if needed
-        return self._image.copy()
+        # render() never writes into the frame it gets, so the image can be shared
+        return self._image
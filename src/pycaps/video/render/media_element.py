@@ -1,8 +1,48 @@
 import cv2
+import importlib.util
 import numpy as np
 from abc import ABC, abstractmethod
 from typing import Callable, Union, Tuple, Optional
-import inspect
+
+# numba comes with librosa; without it render() uses the NumPy blend. The kernel is compiled on first
+# use rather than at import time, since importing numba alone takes longer than importing the rest.
+_NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+_compiled_blend_bgra_frame = None
+
+def _blend_bgra_frame(roi: np.ndarray, sub_fr: np.ndarray, alpha_scale: float) -> None:
+    """Blend a BGRA frame into roi (BGR or BGRA) in place, in one pass and without temporaries.
+    
+    alpha_scale is opacity / 255, so sub_fr[..., 3] * alpha_scale is the frame alpha in [0, 1].
+    """
+    for y in range(roi.shape[0]):
+        for x in range(roi.shape[1]):
+            frame_alpha = sub_fr[y, x, 3] * alpha_scale
+            if roi.shape[2] == 3:
+                for c in range(3):
+                    # float() first: with uint8 arrays the subtraction would wrap around under Numba
+                    background = float(roi[y, x, c])
+                    value = background + (float(sub_fr[y, x, c]) - background) * frame_alpha
+                    roi[y, x, c] = min(max(value, 0.0), 255.0)
+            else:
+                bg_weight = roi[y, x, 3] / 255.0 * (1.0 - frame_alpha)
+                final_alpha = frame_alpha + bg_weight
+                inv_final_alpha = 1.0 / min(max(final_alpha, 1e-6), 1.0)
+                for c in range(3):
+                    value = (sub_fr[y, x, c] * frame_alpha + roi[y, x, c] * bg_weight) * inv_final_alpha
+                    roi[y, x, c] = min(max(value, 0.0), 255.0)
+                roi[y, x, 3] = min(max(final_alpha * 255.0, 0.0), 255.0)
+
+def _get_blend_kernel() -> Optional[Callable[[np.ndarray, np.ndarray, float], None]]:
+    """The Numba-compiled _blend_bgra_frame, or None when numba isn't available."""
+    global _NUMBA_AVAILABLE, _compiled_blend_bgra_frame
+    if _compiled_blend_bgra_frame is None and _NUMBA_AVAILABLE:
+        try:
+            from numba import njit
+        except ImportError:
+            _NUMBA_AVAILABLE = False
+        else:
+            _compiled_blend_bgra_frame = njit(cache=True, fastmath=True)(_blend_bgra_frame)
+    return _compiled_blend_bgra_frame
 
 class MediaElement(ABC):
     def __init__(self, start: float, duration: float):
@@ -12,6 +52,8 @@ class MediaElement(ABC):
         self._position: Callable[[float], Tuple[int, int]] = lambda t: (0, 0)
         self._opacity: Callable[[float], float] = lambda t: 1
         self._scale: Callable[[float], float] = lambda t: 1
+        # (source frame, target size, interpolation, resized frame) of the last resize
+        self._resize_cache: Optional[Tuple[np.ndarray, Tuple[int, int], int, np.ndarray]] = None
 
     def set_position(self, value: Union[Callable[[float], Tuple[int, int]], Tuple[int, int]]):
         self._position = self._save_as_function(value)
@@ -43,7 +85,7 @@ class MediaElement(ABC):
         self._size = (new_w, new_h)
 
     def _save_as_function(self, value: Union[Callable, float, Tuple[int, int]]) -> Callable:
-        if inspect.isfunction(value):
+        if callable(value):
             return value
         return lambda t, v=value: v
 
@@ -79,16 +121,30 @@ class MediaElement(ABC):
     def get_frame(self, t_rel: float) -> np.ndarray:
         pass
 
+    def _resize(self, frame: np.ndarray, size: Tuple[int, int], interpolation: int) -> np.ndarray:
+        # static elements (images, held video frames) get the same frame object every time: resize it only once
+        cached = self._resize_cache
+        if cached is not None and cached[0] is frame and cached[1] == size and cached[2] == interpolation:
+            return cached[3]
+
+        resized = cv2.resize(frame, size, interpolation=interpolation)
+        if interpolation == cv2.INTER_CUBIC and resized.dtype != np.uint8:
+            # only cubic interpolation can overshoot [0, 255] (INTER_AREA averages, uint8 output saturates)
+            np.clip(resized, 0.0, 255.0, out=resized)
+        self._resize_cache = (frame, size, interpolation, resized)
+        return resized
+
     def render(self, bg: np.ndarray, t_global: float) -> np.ndarray:
         t_rel = (t_global - self._start)
         if not (0 <= t_rel < self._duration):
             return bg
 
         frame = self.get_frame(t_rel)
-        x, y = self.position(t_rel)
+        # call the stored callables directly: this runs for every element on every frame
+        x, y = self._position(t_rel)
         x, y = int(x), int(y)
-        s = self.scale(t_rel)
-        alpha_val = self.opacity(t_rel)
+        s = self._scale(t_rel)
+        alpha_val = self._opacity(t_rel)
 
         # TODO: I think there's room for performance improvement over here... 
 
@@ -96,14 +152,9 @@ class MediaElement(ABC):
         # "To shrink an image, it will generally look best with INTER_AREA interpolation, whereas to enlarge an image,
         #  it will generally look best with INTER_CUBIC (slow) or INTER_LINEAR (faster but still looks OK)."
         interpolation_method = cv2.INTER_AREA if s < 1.0 else cv2.INTER_CUBIC
-        scaled_w, scaled_h = int(self._size[0] * s), int(self._size[1] * s)
-        frame = cv2.resize(frame, (scaled_w, scaled_h), interpolation=interpolation_method)
-        frame = np.clip(frame, 0.0, 255.0)
-        if frame.shape[2] == 3:
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA)
-
-        # apply opacity
-        frame[:, :, 3] = frame[:, :, 3] * alpha_val
+        scaled_size = (int(self._size[0] * s), int(self._size[1] * s))
+        if scaled_size != (frame.shape[1], frame.shape[0]):
+            frame = self._resize(frame, scaled_size, interpolation_method)
 
         H, W = bg.shape[:2]
         h, w = frame.shape[:2]
@@ -126,22 +177,43 @@ class MediaElement(ABC):
 
         roi = bg[y1_bg:y2_bg, x1_bg:x2_bg]
         sub_fr = frame[y1_fr:y2_fr, x1_fr:x2_fr]
-        frame_alpha = sub_fr[..., 3:4] / 255.0
+        if sub_fr.shape[2] == 3 and bg.shape[2] == 3 and bg.dtype == np.uint8:
+            # uniform opacity over a video frame: OpenCV's SIMD weighted sum, saturated straight to uint8
+            roi[...] = cv2.addWeighted(sub_fr, alpha_val, roi, 1.0 - alpha_val, 0.0, dtype=cv2.CV_8U)
+            return bg
+
+        blend_kernel = _get_blend_kernel() if sub_fr.shape[2] == 4 else None
+        if blend_kernel is not None:
+            # fused per-pixel blend: one pass over the ROI instead of a chain of full-size NumPy temporaries
+            blend_kernel(roi, sub_fr, alpha_val / 255.0)
+            return bg
+
+        # apply opacity, only over the visible part of the frame
+        if sub_fr.shape[2] == 4:
+            frame_alpha = sub_fr[..., 3:4] * (alpha_val / 255.0)
+        else:
+            # BGR frame: the opacity is the only alpha, so there is no need to build an alpha channel for it
+            frame_alpha = alpha_val
         roi_float = roi.astype(np.float32) if roi.dtype != np.float32 else roi
 
         if bg.shape[2] == 3:
-            # background is BGR format
-            blended_roi = sub_fr[..., :3] * frame_alpha + roi_float * (1.0 - frame_alpha)
+            # background is BGR format: roi + (frame - roi) * alpha is one multiply instead of two
+            blended_rgb = roi_float + (sub_fr[..., :3] - roi_float) * frame_alpha
+            np.clip(blended_rgb, 0, 255, out=blended_rgb)
+            roi[...] = blended_rgb
         else:
             # background is BGRA format (it can happen for composite elements)
-            bg_alpha = roi[..., 3:4] / 255.0
-            final_alpha = frame_alpha + bg_alpha * (1.0 - frame_alpha)
-
-            blended_rgb = (sub_fr[..., :3] * frame_alpha + roi_float[..., :3] * bg_alpha * (1.0 - frame_alpha)) / np.clip(final_alpha, 1e-6, 1.0)
-            blended_alpha = final_alpha * 255.0
-            blended_roi = np.concatenate([blended_rgb, blended_alpha], axis=-1)
-
-        final_roi = np.clip(blended_roi, 0, 255)
-        bg[y1_bg:y2_bg, x1_bg:x2_bg] = final_roi.astype(bg.dtype)
+            bg_weight = roi_float[..., 3:4] / 255.0 * (1.0 - frame_alpha)
+            final_alpha = frame_alpha + bg_weight
+
+            blended_rgb = sub_fr[..., :3] * frame_alpha + roi_float[..., :3] * bg_weight
+            # one reciprocal per pixel, shared by the three color channels
+            blended_rgb *= 1.0 / np.clip(final_alpha, 1e-6, 1.0)
+            np.clip(blended_rgb, 0, 255, out=blended_rgb)
+            final_alpha *= 255.0
+            np.clip(final_alpha, 0, 255, out=final_alpha)
+            # roi is a view of bg, so this writes the blended pixels straight into the background
+            roi[..., :3] = blended_rgb
+            roi[..., 3:4] = final_alpha
 
         return bg
@@ -40,4 +40,4 @@ class PngSequenceElement(MediaElement):
         idx = int(t_rel * self._fps)
         idx = max(0, min(idx, self._num_frames - 1))
         
-        return self._frames[idx].copy()
+        return self._frames[idx]
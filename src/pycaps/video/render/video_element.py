@@ -19,7 +19,7 @@ class VideoElement(MediaElement):
     def get_frame(self, t_rel: float) -> np.ndarray:
         idx = int(t_rel * self._fps)
         idx = max(0, min(idx, self._num_frames - 1))
-        return self._frames[idx].copy()
+        return self._frames[idx]
 
     def _load_metadata(self, path: str) -> None:
         cmd = ["ffmpeg", "-hide_banner", "-i", path]